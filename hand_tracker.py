@@ -3,18 +3,90 @@ Real-Time Hand Tracking System with Virtual Boundary Detection
 Arvyax Internship Assignment
 
 This system tracks hand position using classical computer vision techniques
-(color segmentation, contours, convex hull) without using MediaPipe or OpenPose.
+(color segmentation, morphology, connected components) without using MediaPipe
+or OpenPose.
 """
 
 import cv2
+import math
+import os
 import numpy as np
 import time
+import queue
+import threading
 from typing import Tuple, Optional, List
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to OpenCV
+    njit = None
+
+
+if njit is not None:
+    # Fixed-point division tables used by cv2.cvtColor(COLOR_BGR2HSV) for
+    # 8-bit images (hsv_shift = 12, entries rounded half-to-even like cvRound)
+    _HSV_SHIFT = 12
+    _SDIV_TABLE = np.zeros(256, dtype=np.int64)
+    _SDIV_TABLE[1:] = np.round((255 << _HSV_SHIFT) / np.arange(1, 256))
+    _HDIV_TABLE = np.zeros(256, dtype=np.int64)
+    _HDIV_TABLE[1:] = np.round((180 << _HSV_SHIFT) / (6.0 * np.arange(1, 256)))
+    
+    @njit(parallel=True, boundscheck=False, fastmath=True, cache=True)
+    def bgr_to_skin_mask(bgr: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                         out: np.ndarray) -> np.ndarray:
+        """
+        Fused BGR -> HSV conversion and skin range threshold.
+        
+        Uses the same 8-bit fixed-point HSV arithmetic as cv2.cvtColor
+        (H in [0, 180)) but never materializes the HSV image.
+        
+        Args:
+            bgr: Input BGR image (uint8)
+            lower: Lower HSV bound
+            upper: Upper HSV bound
+            out: Preallocated single-channel output mask
+            
+        Returns:
+            The filled mask (``out``)
+        """
+        half = 1 << (_HSV_SHIFT - 1)
+        height, width = out.shape
+        for y in prange(height):
+            for x in range(width):
+                # Signed so channel differences can go negative
+                b = np.int64(bgr[y, x, 0])
+                g = np.int64(bgr[y, x, 1])
+                r = np.int64(bgr[y, x, 2])
+                
+                v = max(r, g, b)
+                diff = v - min(r, g, b)
+                s = (diff * _SDIV_TABLE[v] + half) >> _HSV_SHIFT
+                
+                if v == r:
+                    num = g - b
+                elif v == g:
+                    num = b - r + 2 * diff
+                else:
+                    num = r - g + 4 * diff
+                # Round first, then wrap negative hues (as OpenCV does)
+                hue = (num * _HDIV_TABLE[diff] + half) >> _HSV_SHIFT
+                if hue < 0:
+                    hue += 180
+                
+                if (lower[0] <= hue <= upper[0] and
+                        lower[1] <= s <= upper[1] and
+                        lower[2] <= v <= upper[2]):
+                    out[y, x] = 255
+                else:
+                    out[y, x] = 0
+        return out
+else:
+    bgr_to_skin_mask = None
+
 
 class HandTracker:
     """
-    Hand tracking system using skin color detection and contour analysis.
+    Hand tracking system using skin color detection and connected component analysis.
     """
     
     def __init__(self, camera_index: int = 0):
@@ -28,6 +100,12 @@ class HandTracker:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         
+        # Keep only the newest frame in the driver queue so read() never
+        # returns stale frames; MJPG reduces USB bus traffic
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        
         # Virtual boundary (center circle)
         self.boundary_center = (320, 240)  # Center of 640x480 frame
         self.boundary_radius = 100
@@ -36,66 +114,179 @@ class HandTracker:
         self.danger_threshold = 50   # pixels
         self.warning_threshold = 120  # pixels
         
+        # Squared thresholds so update_state can skip the sqrt
+        self._danger_sq = self.danger_threshold ** 2
+        self._warning_sq = self.warning_threshold ** 2
+        
         # State tracking
         self.current_state = "SAFE"
         self.hand_position = None
         
+        # Debug mode shows the detection mask window (toggle with 'd')
+        self.debug = False
+        
         # Performance tracking
         self.fps = 0
-        self.frame_times = []
+        # Ring buffer of the last 30 frame times with a running sum
+        self._ft = [0.0] * 30
+        self._ft_idx = 0
+        self._ft_sum = 0.0
+        self._ft_count = 0
         
         # HSV range for skin detection (works for various skin tones)
         self.lower_skin = np.array([0, 20, 70], dtype=np.uint8)
         self.upper_skin = np.array([20, 255, 255], dtype=np.uint8)
         
-    def detect_hand(self, frame: np.ndarray) -> Tuple[Optional[Tuple[int, int]], np.ndarray]:
+        # Detection runs on a frame downscaled by this factor (640x480 -> 320x240)
+        self.detection_scale = 2
+        self.min_hand_area = 3000 // (self.detection_scale ** 2)
+        
+        # Run detection every Nth captured frame and reuse the last result in between
+        self._detect_stride = 2
+        self._tick = 0
+        self._last_hand = None
+        
+        # Use one OpenCV worker per physical core (assumes 2-way SMT)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) // 2))
+        self._parallel_framework = "unknown"
+        for line in cv2.getBuildInformation().splitlines():
+            if "Parallel framework" in line:
+                self._parallel_framework = line.split(":", 1)[1].strip()
+                break
+        
+        # Skin mask implementation: the Numba kernel is opt-in (USE_NUMBA=1)
+        # for OpenCV builds without SIMD/TBB, otherwise cvtColor + inRange
+        use_numba = os.environ.get('USE_NUMBA', '') not in ('', '0')
+        if use_numba and bgr_to_skin_mask is None:
+            print("WARNING: USE_NUMBA is set but Numba is not installed; using OpenCV")
+            use_numba = False
+        self._mask_fn = bgr_to_skin_mask if use_numba else self._opencv_mask
+        
+        # Use OpenCV's Transparent API (OpenCL) for the mask pipeline when
+        # available, unless the Numba kernel was requested
+        self._use_umat = cv2.ocl.haveOpenCL() and not use_numba
+        
+        # Constants reused every frame
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (7, 7))
+        self._font = cv2.FONT_HERSHEY_SIMPLEX
+        self._state_colors = {
+            "SAFE": (0, 255, 0),      # Green
+            "WARNING": (0, 255, 255),  # Yellow
+            "DANGER": (0, 0, 255)      # Red
+        }
+        
+        # Pre-rendered virtual boundary layer, built from the first frame's size
+        self._static_shape = None
+        
+        # Detection size and reusable per-frame buffers; reallocated by
+        # detect_hand if the camera delivers a different resolution
+        self._allocate_detection_buffers((480, 640))
+        
+    def _allocate_detection_buffers(self, frame_shape: Tuple[int, int]):
         """
-        Detect hand using skin color segmentation and contour analysis.
+        Size the detection pipeline for a given frame resolution.
         
         Args:
-            frame: Input BGR frame
+            frame_shape: Frame (height, width)
+        """
+        height, width = frame_shape
+        det_w = max(1, width // self.detection_scale)
+        det_h = max(1, height // self.detection_scale)
+        
+        self._frame_shape = (height, width)
+        self.detection_size = (det_w, det_h)
+        # Separate x/y factors map detection coordinates back to the frame
+        self._scale_x = width / det_w
+        self._scale_y = height / det_h
+        
+        # Reusable per-frame buffers (avoid allocating images every frame)
+        self._small = np.empty((det_h, det_w, 3), dtype=np.uint8)
+        self._hsv = np.empty((det_h, det_w, 3), dtype=np.uint8)
+        self._mask = np.empty((det_h, det_w), dtype=np.uint8)
+    
+    def _opencv_mask(self, bgr: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                     out: np.ndarray) -> np.ndarray:
+        """
+        Skin mask via cv2.cvtColor + cv2.inRange into preallocated buffers.
+        
+        Same signature as bgr_to_skin_mask so the two are interchangeable.
+        
+        Args:
+            bgr: Input BGR image
+            lower: Lower HSV bound
+            upper: Upper HSV bound
+            out: Preallocated single-channel output mask
             
         Returns:
-            Tuple of (hand_center_position, mask)
+            The filled mask (``out``)
+        """
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        return cv2.inRange(hsv, lower, upper, dst=out)
+    
+    def detect_hand(self, frame: np.ndarray) -> Tuple[Optional[Tuple[int, int]], Optional[np.ndarray]]:
         """
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        Detect hand using skin color segmentation and connected components.
         
-        # Apply Gaussian blur to reduce noise
-        hsv = cv2.GaussianBlur(hsv, (5, 5), 0)
+        The mask pipeline runs on a downscaled copy of the frame; the
+        returned centroid is scaled back to full-frame coordinates.
         
-        # Create mask for skin color
-        mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
+        Args:
+            frame: Input BGR frame
+            
+        Returns:
+            Tuple of (hand_center_position, low-resolution mask); the mask
+            is None unless debug mode is enabled
+        """
+        if frame.shape[:2] != self._frame_shape:
+            self._allocate_detection_buffers(frame.shape[:2])
+        
+        # Create mask for skin color (noise is removed by the morphological
+        # opening below, so no Gaussian pre-smoothing of the HSV image).
+        # Downscale first to reduce pixels touched by every stage.
+        if self._use_umat:
+            # OpenCL path: keep the whole mask pipeline on the device
+            small = cv2.resize(cv2.UMat(frame), self.detection_size,
+                               interpolation=cv2.INTER_AREA)
+            hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+            mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
+        else:
+            small = cv2.resize(frame, self.detection_size, dst=self._small,
+                               interpolation=cv2.INTER_AREA)
+            mask = self._mask_fn(small, self.lower_skin, self.upper_skin, self._mask)
         
         # Morphological operations to clean up the mask
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel, iterations=2)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel, iterations=1)
+        # (rectangular kernel lets OpenCV use its separable fast path)
+        kernel = self._kernel
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel, dst=mask, iterations=2)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel, dst=mask, iterations=2)
         
         # Dilate to make hand region more prominent
-        mask = cv2.dilate(mask, kernel, iterations=1)
+        mask = cv2.dilate(mask, kernel, dst=mask, iterations=1)
+        
+        # Connected components need a host array
+        if self._use_umat:
+            mask = mask.get()
         
-        # Find contours
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Label skin regions; area and centroid of every region in one pass
+        n_labels, _, stats, centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
         
-        if not contours:
-            return None, mask
+        debug_mask = mask if self.debug else None
         
-        # Find the largest contour (assumed to be the hand)
-        largest_contour = max(contours, key=cv2.contourArea)
+        # Label 0 is the background
+        if n_labels < 2:
+            return None, debug_mask
         
-        # Filter out small contours (noise)
-        if cv2.contourArea(largest_contour) < 3000:
-            return None, mask
+        # Find the largest region (assumed to be the hand)
+        largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
         
-        # Calculate centroid of the hand
-        M = cv2.moments(largest_contour)
-        if M["m00"] != 0:
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            return (cx, cy), mask
+        # Filter out small regions (noise)
+        if stats[largest, cv2.CC_STAT_AREA] < self.min_hand_area:
+            return None, debug_mask
         
-        return None, mask
+        # Centroid of the hand, scaled back to full-frame coordinates
+        cx = int(centroids[largest][0] * self._scale_x)
+        cy = int(centroids[largest][1] * self._scale_y)
+        return (cx, cy), debug_mask
     
     def calculate_distance(self, point1: Tuple[int, int], point2: Tuple[int, int]) -> float:
         """
@@ -108,47 +299,93 @@ class HandTracker:
         Returns:
             Distance in pixels
         """
-        return np.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+        return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
     
-    def update_state(self, distance: float) -> str:
+    def squared_distance(self, point1: Tuple[int, int], point2: Tuple[int, int]) -> int:
+        """
+        Calculate squared Euclidean distance between two points.
+        
+        Args:
+            point1: First point (x, y)
+            point2: Second point (x, y)
+            
+        Returns:
+            Squared distance in pixels
+        """
+        dx = point1[0] - point2[0]
+        dy = point1[1] - point2[1]
+        return dx * dx + dy * dy
+    
+    def update_state(self, dist_sq: int) -> str:
         """
         Update system state based on distance to boundary.
         
         Args:
-            distance: Distance from hand to boundary center
+            dist_sq: Squared distance from hand to boundary center
             
         Returns:
             Current state string
         """
-        if distance <= self.danger_threshold:
+        if dist_sq <= self._danger_sq:
             return "DANGER"
-        elif distance <= self.warning_threshold:
+        elif dist_sq <= self._warning_sq:
             return "WARNING"
         else:
             return "SAFE"
     
-    def draw_virtual_boundary(self, frame: np.ndarray):
+    def _render_static_overlay(self, frame_shape: Tuple[int, int]):
         """
-        Draw the virtual boundary object on the frame.
+        Render the virtual boundary once into a cached layer.
+        
+        The boundary never changes, so it is drawn onto a black image of the
+        frame's size here and only composited onto each frame by
+        draw_virtual_boundary. The layer is cropped to the bounding box of
+        the drawn pixels.
         
         Args:
-            frame: Frame to draw on
+            frame_shape: Frame (height, width)
         """
+        self._static_shape = frame_shape
+        layer = np.zeros((frame_shape[0], frame_shape[1], 3), dtype=np.uint8)
+        
         # Draw outer circle (warning zone)
-        cv2.circle(frame, self.boundary_center, self.warning_threshold, 
+        cv2.circle(layer, self.boundary_center, self.warning_threshold, 
                   (0, 255, 255), 2)  # Yellow
         
         # Draw danger zone circle
-        cv2.circle(frame, self.boundary_center, self.danger_threshold, 
+        cv2.circle(layer, self.boundary_center, self.danger_threshold, 
                   (0, 0, 255), 2)  # Red
         
         # Draw center point
-        cv2.circle(frame, self.boundary_center, 5, (255, 0, 255), -1)
+        cv2.circle(layer, self.boundary_center, 5, (255, 0, 255), -1)
         
         # Add labels
-        cv2.putText(frame, "DANGER ZONE", 
+        cv2.putText(layer, "DANGER ZONE", 
                    (self.boundary_center[0] - 70, self.boundary_center[1]),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+                   self._font, 0.5, (0, 0, 255), 1)
+        
+        # All boundary colors are non-black, so any nonzero channel marks a drawn pixel
+        drawn = layer.any(axis=2)
+        ys, xs = np.nonzero(drawn)
+        if ys.size:
+            self._static_roi = (slice(ys.min(), ys.max() + 1), slice(xs.min(), xs.max() + 1))
+        else:
+            # Boundary lies entirely outside the frame
+            self._static_roi = (slice(0, 0), slice(0, 0))
+        self._static_overlay = layer[self._static_roi].copy()
+        self._static_mask = drawn[self._static_roi][..., None]
+    
+    def draw_virtual_boundary(self, frame: np.ndarray):
+        """
+        Draw the virtual boundary object on the frame.
+        
+        Args:
+            frame: Frame to draw on
+        """
+        if frame.shape[:2] != self._static_shape:
+            self._render_static_overlay(frame.shape[:2])
+        
+        np.copyto(frame[self._static_roi], self._static_overlay, where=self._static_mask)
     
     def draw_tracking_info(self, frame: np.ndarray):
         """
@@ -175,7 +412,7 @@ class HandTracker:
             mid_y = (y + self.boundary_center[1]) // 2
             cv2.putText(frame, f"{int(distance)}px", 
                        (mid_x, mid_y - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                       self._font, 0.6, (255, 255, 255), 2)
     
     def draw_state_overlay(self, frame: np.ndarray):
         """
@@ -186,24 +423,16 @@ class HandTracker:
         """
         height, width = frame.shape[:2]
         
-        # State colors
-        state_colors = {
-            "SAFE": (0, 255, 0),      # Green
-            "WARNING": (0, 255, 255),  # Yellow
-            "DANGER": (0, 0, 255)      # Red
-        }
-        
-        color = state_colors[self.current_state]
+        color = self._state_colors[self.current_state]
         
-        # Draw state background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (width, 60), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # Draw state background (darken header strip to 30% in place)
+        header = frame[:60]
+        np.multiply(header, 0.3, out=header, casting='unsafe')
         
         # Draw state text
         cv2.putText(frame, f"STATE: {self.current_state}", 
                    (10, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
+                   self._font, 1.2, color, 3)
         
         # DANGER DANGER warning
         if self.current_state == "DANGER":
@@ -211,7 +440,7 @@ class HandTracker:
             if int(time.time() * 4) % 2 == 0:
                 # Draw large warning text
                 text = "!!! DANGER DANGER !!!"
-                text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_BOLD, 1.5, 4)[0]
+                text_size = cv2.getTextSize(text, self._font, 1.5, 4)[0]
                 text_x = (width - text_size[0]) // 2
                 text_y = height - 30
                 
@@ -222,12 +451,12 @@ class HandTracker:
                 
                 # Text
                 cv2.putText(frame, text, (text_x, text_y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 4)
+                           self._font, 1.5, (255, 255, 255), 4)
         
         # Draw FPS counter
         cv2.putText(frame, f"FPS: {self.fps:.1f}", 
                    (width - 120, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                   self._font, 0.7, (255, 255, 255), 2)
     
     def update_fps(self, frame_time: float):
         """
@@ -236,20 +465,75 @@ class HandTracker:
         Args:
             frame_time: Time taken for current frame
         """
-        self.frame_times.append(frame_time)
-        
-        # Keep only last 30 frames for averaging
-        if len(self.frame_times) > 30:
-            self.frame_times.pop(0)
+        # Keep only last 30 frames for averaging (overwrite the oldest slot)
+        size = len(self._ft)
+        old = self._ft[self._ft_idx]
+        self._ft[self._ft_idx] = frame_time
+        self._ft_sum += frame_time - old
+        self._ft_idx = (self._ft_idx + 1) % size
+        self._ft_count = min(self._ft_count + 1, size)
         
         # Calculate average FPS
-        if self.frame_times:
-            avg_time = sum(self.frame_times) / len(self.frame_times)
-            self.fps = 1.0 / avg_time if avg_time > 0 else 0
+        self.fps = self._ft_count / self._ft_sum if self._ft_sum > 0 else 0
+    
+    def _capture_loop(self, frames: queue.Queue, stop_event: threading.Event):
+        """
+        Capture and detection loop, run on a background thread.
+        
+        Only the newest result is kept in ``frames``: if the display thread
+        has not consumed the previous one yet, it is dropped.
+        
+        Args:
+            frames: Single-slot queue of (frame, hand_position, mask); mask
+                is None on frames where detection was skipped
+            stop_event: Set to request shutdown (and set here when the loop
+                exits, e.g. on capture failure or an exception)
+        """
+        # Always signal the display loop on exit, including when detection
+        # raises, so run() does not wait forever on an empty queue
+        try:
+            # The OpenCL switch is per-thread, so it must be set on the thread
+            # that runs detect_hand
+            cv2.ocl.setUseOpenCL(self._use_umat)
+            
+            while not stop_event.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    print("Failed to grab frame")
+                    break
+            
+                # Flip frame horizontally for mirror effect
+                frame = cv2.flip(frame, 1)
+            
+                # Detect hand on every Nth frame only (copy the mask since its
+                # buffer is reused next frame)
+                self._tick += 1
+                if self._tick % self._detect_stride == 0:
+                    hand_pos, mask = self.detect_hand(frame)
+                    self._last_hand = hand_pos
+                    if mask is not None:
+                        mask = mask.copy()
+                else:
+                    hand_pos, mask = self._last_hand, None
+            
+                item = (frame, hand_pos, mask)
+                try:
+                    frames.put_nowait(item)
+                except queue.Full:
+                    try:
+                        frames.get_nowait()
+                    except queue.Empty:
+                        pass
+                    frames.put_nowait(item)
+        finally:
+            stop_event.set()
     
     def run(self):
         """
         Main loop for hand tracking system.
+        
+        Capture and detection run on a background thread; drawing, display
+        and key handling stay on the calling (GUI) thread.
         """
         print("=" * 60)
         print("Hand Tracking System - Arvyax Assignment")
@@ -260,35 +544,55 @@ class HandTracker:
         print("- Observe state changes: SAFE -> WARNING -> DANGER")
         print("- Press 'q' to quit")
         print("- Press 'c' to calibrate skin color (optional)")
+        print("- Press 'd' to toggle the detection mask window")
         print("\nStarting camera...")
         
         if not self.cap.isOpened():
             print("ERROR: Could not open camera!")
             return
         
-        print("Camera opened successfully!\n")
+        print("Camera opened successfully!")
+        
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if (width, height) != (640, 480):
+            print(f"WARNING: Camera delivered {width}x{height} instead of 640x480; "
+                  "the virtual boundary assumes 640x480")
+        print(f"OpenCV threads: {cv2.getNumThreads()} of {cv2.getNumberOfCPUs()} CPUs "
+              f"(parallel framework: {self._parallel_framework})\n")
         
         calibration_mode = False
         
-        while True:
-            start_time = time.time()
-            
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Failed to grab frame")
-                break
-            
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+        # pollKey (OpenCV >= 4.5) pumps GUI events without waitKey's 1 ms sleep
+        if hasattr(cv2, 'pollKey'):
+            poll_key = cv2.pollKey
+        else:
+            def poll_key():
+                return cv2.waitKey(1)
+        
+        frames = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        capture_thread = threading.Thread(target=self._capture_loop,
+                                          args=(frames, stop_event), daemon=True)
+        capture_thread.start()
+        
+        start_time = time.time()
+        
+        while not stop_event.is_set():
+            try:
+                frame, hand_pos, mask = frames.get(timeout=0.1)
+            except queue.Empty:
+                # Keep the GUI responsive (and 'q' working) if capture stalls
+                if (poll_key() & 0xFF) == ord('q'):
+                    break
+                continue
             
-            # Detect hand
-            hand_pos, mask = self.detect_hand(frame)
             self.hand_position = hand_pos
             
             # Update state if hand is detected
             if hand_pos:
-                distance = self.calculate_distance(hand_pos, self.boundary_center)
-                self.current_state = self.update_state(distance)
+                dist_sq = self.squared_distance(hand_pos, self.boundary_center)
+                self.current_state = self.update_state(dist_sq)
             else:
                 self.current_state = "SAFE"
             
@@ -301,26 +605,40 @@ class HandTracker:
             if calibration_mode:
                 cv2.putText(frame, "CALIBRATION MODE - Adjust lighting", 
                            (10, 100),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                           self._font, 0.6, (0, 255, 255), 2)
             
             # Display frames
             cv2.imshow('Hand Tracking System', frame)
-            cv2.imshow('Hand Detection Mask', mask)
+            if self.debug and mask is not None:
+                cv2.imshow('Hand Detection Mask', mask)
             
-            # Update FPS
-            frame_time = time.time() - start_time
-            self.update_fps(frame_time)
+            # Update FPS (time between displayed frames)
+            now = time.time()
+            self.update_fps(now - start_time)
+            start_time = now
             
             # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('c'):
                 calibration_mode = not calibration_mode
                 print(f"Calibration mode: {'ON' if calibration_mode else 'OFF'}")
+            elif key == ord('d'):
+                self.debug = not self.debug
+                if not self.debug:
+                    cv2.destroyWindow('Hand Detection Mask')
+                print(f"Debug mask window: {'ON' if self.debug else 'OFF'}")
         
         # Cleanup
-        self.cap.release()
+        stop_event.set()
+        # cap.read() may block indefinitely (e.g. camera unplugged); the
+        # daemon thread is abandoned rather than hanging shutdown. Only
+        # release the capture once no thread is using it; otherwise leave it
+        # to process exit.
+        capture_thread.join(timeout=1.0)
+        if not capture_thread.is_alive():
+            self.cap.release()
         cv2.destroyAllWindows()
         
         print("\n" + "=" * 60)
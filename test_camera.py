@@ -72,11 +72,9 @@ try:
     print("  ✓ Window created successfully")
     print("  A test window should appear. Press 'q' to close it.")
     
-    # Wait for 'q' key
-    while True:
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q'):
-            break
+    # Wait for 'q' key (block on input; the window content never changes)
+    while (cv2.waitKey(0) & 0xFF) != ord('q'):
+        pass
     
     cv2.destroyAllWindows()
     print("  ✓ Window closed successfully")
@@ -0,0 +1,75 @@
+"""
+Check that the Numba skin mask kernel matches cv2.cvtColor + cv2.inRange
+"""
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("numba")
+
+from hand_tracker import bgr_to_skin_mask
+
+
+LOWER_SKIN = np.array([0, 20, 70], dtype=np.uint8)
+UPPER_SKIN = np.array([20, 255, 255], dtype=np.uint8)
+
+
+def test_skin_mask_matches_opencv():
+    # Grid of BGR colors plus known hue-wrap edge cases, as a 1-row image
+    levels = np.arange(0, 256, 3, dtype=np.uint8)
+    b, g, r = np.meshgrid(levels, levels, levels, indexing="ij")
+    grid = np.stack([b.ravel(), g.ravel(), r.ravel()], axis=1)
+    edge_cases = np.array([[1, 0, 70], [1, 0, 255], [2, 0, 200]], dtype=np.uint8)
+    bgr = np.concatenate([grid, edge_cases])[None, :, :]
+    
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    expected = cv2.inRange(hsv, LOWER_SKIN, UPPER_SKIN)
+    
+    out = np.empty(bgr.shape[:2], dtype=np.uint8)
+    bgr_to_skin_mask(bgr, LOWER_SKIN, UPPER_SKIN, out)
+    
+    mismatched = bgr[0][out[0] != expected[0]]
+    assert len(mismatched) == 0, f"{len(mismatched)} colors differ, e.g. {mismatched[:5]}"
+
+
+class _FakeCapture:
+    """Stand-in for cv2.VideoCapture so HandTracker can be built without a camera."""
+    
+    def __init__(self, *args):
+        pass
+    
+    def set(self, *args):
+        return False
+    
+    def release(self):
+        pass
+
+
+def _make_tracker(monkeypatch, use_numba):
+    import hand_tracker
+    
+    monkeypatch.setattr(hand_tracker.cv2, "VideoCapture", _FakeCapture)
+    if use_numba:
+        monkeypatch.setenv("USE_NUMBA", "1")
+    else:
+        monkeypatch.delenv("USE_NUMBA", raising=False)
+    return hand_tracker.HandTracker(camera_index=0)
+
+
+def test_detect_hand_with_numba_mask(monkeypatch):
+    # Skin-colored square (BGR (120, 160, 220) -> H=12, S=116, V=220) on black
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[100:200, 400:500] = (120, 160, 220)
+    
+    numba_tracker = _make_tracker(monkeypatch, use_numba=True)
+    assert numba_tracker._mask_fn is bgr_to_skin_mask
+    assert not numba_tracker._use_umat
+    hand_pos, _ = numba_tracker.detect_hand(frame)
+    
+    opencv_tracker = _make_tracker(monkeypatch, use_numba=False)
+    opencv_tracker._use_umat = False
+    expected_pos, _ = opencv_tracker.detect_hand(frame)
+    
+    assert hand_pos == expected_pos
+    assert abs(hand_pos[0] - 450) <= 2 and abs(hand_pos[1] - 150) <= 2